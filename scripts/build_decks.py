@@ -0,0 +1,170 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+DECKS = [
+    "index.html",
+    "Policy Laundery List Version.html",
+]
+
+OUT_DIR = PROJECT_ROOT / "dist"
+ASSET_DIR_NAME = "assets"
+HASH_LEN = 12
+
+ASSET_EXTENSIONS = ("png", "jpg", "jpeg", "gif", "svg", "webp", "ico", "woff", "woff2", "ttf", "otf", "css", "js")
+
+# Local references in src/href/data-* attributes and CSS url(...) values.
+ASSET_REF = re.compile(
+    r"""(?P<open>["'(])(?P<ref>[^"'()\s<>]+\.(?:%s))(?P<close>["')])""" % "|".join(ASSET_EXTENSIONS),
+    re.IGNORECASE,
+)
+
+
+def is_local_ref(ref):
+    return not (
+        "://" in ref
+        or ref.startswith("//")
+        or ref.startswith("data:")
+        or ref.startswith("#")
+        or ref.startswith(ASSET_DIR_NAME + "/")
+    )
+
+
+def find_asset_refs(deck_path, html):
+    refs = set()
+    for m in ASSET_REF.finditer(html):
+        ref = m.group("ref")
+        if not is_local_ref(ref):
+            continue
+        source = (deck_path.parent / ref).resolve()
+        if source.is_file():
+            refs.add(source)
+    return refs
+
+
+def file_digest(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def hashed_name(source, digest):
+    return f"{source.stem}.{digest[:HASH_LEN]}{source.suffix.lower()}"
+
+
+def store_assets(sources, asset_dir, workers):
+    # Hash every unique source once, then collapse byte-identical files
+    # (e.g. the same chart used by several decks) onto a single stored copy.
+    sources = sorted(sources)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        digests = list(pool.map(file_digest, sources))
+
+    stored = {}
+    mapping = {}
+    for source, digest in zip(sources, digests):
+        if digest not in stored:
+            name = hashed_name(source, digest)
+            target = asset_dir / name
+            # Content-addressed: an existing file with this name and size is
+            # already correct. Copies land under a temporary name first so an
+            # interrupted build never leaves a truncated file at a hashed name.
+            if not target.exists() or target.stat().st_size != source.stat().st_size:
+                tmp = target.with_name(f".{name}.tmp")
+                shutil.copy2(source, tmp)
+                os.replace(tmp, target)
+            stored[digest] = name
+        mapping[source] = f"{ASSET_DIR_NAME}/{stored[digest]}"
+    return mapping
+
+
+def rewrite_deck(deck_path, html, mapping, out_dir):
+    def replace(m):
+        ref = m.group("ref")
+        if not is_local_ref(ref):
+            return m.group(0)
+        source = (deck_path.parent / ref).resolve()
+        if source not in mapping:
+            return m.group(0)
+        return f'{m.group("open")}{mapping[source]}{m.group("close")}'
+
+    out_path = out_dir / deck_path.name
+    out_path.write_text(ASSET_REF.sub(replace, html), encoding="utf-8")
+    return out_path
+
+
+def has_source_fonts():
+    font_dir = PROJECT_ROOT / "fonts"
+    return font_dir.exists() and any(
+        "subset" not in font_file.relative_to(font_dir).parts
+        for pattern in ("*.ttf", "*.otf")
+        for font_file in font_dir.rglob(pattern)
+    )
+
+
+def manifest_key(source):
+    if PROJECT_ROOT in source.parents:
+        return source.relative_to(PROJECT_ROOT).as_posix()
+    return str(source)
+
+
+def build(decks, out_dir, workers=None):
+    deck_paths = [PROJECT_ROOT / d for d in decks]
+    names = [p.name for p in deck_paths]
+    duplicates = sorted({n for n in names if names.count(n) > 1})
+    if duplicates:
+        raise ValueError(f"Decks would overwrite each other in {out_dir}: {', '.join(duplicates)}")
+
+    asset_dir = out_dir / ASSET_DIR_NAME
+    asset_dir.mkdir(parents=True, exist_ok=True)
+    htmls = [p.read_text(encoding="utf-8") for p in deck_paths]
+
+    # Local font subsets replace Google Fonts before asset collection, so the
+    # subset files are hashed and shared like any other asset. The stage needs
+    # fontTools and source TTFs in fonts/, so it only runs when both exist.
+    if has_source_fonts():
+        import subset_fonts
+
+        faces = subset_fonts.build_subsets(htmls)
+        if faces:
+            htmls = [subset_fonts.apply_font_head(html, faces) for html in htmls]
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        ref_sets = list(pool.map(find_asset_refs, deck_paths, htmls))
+    sources = set().union(*ref_sets)
+
+    mapping = store_assets(sources, asset_dir, workers)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        out_paths = list(pool.map(lambda p, h: rewrite_deck(p, h, mapping, out_dir), deck_paths, htmls))
+    for out_path in out_paths:
+        print(f"Saved: {out_path}")
+
+    manifest = {
+        manifest_key(source): asset
+        for source, asset in sorted(mapping.items())
+    }
+    manifest_path = out_dir / "asset-manifest.json"
+    manifest_path.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+
+    unique = len(set(mapping.values()))
+    print(f"Stored {unique} unique assets for {len(mapping)} references across {len(deck_paths)} decks")
+    print(f"Saved: {manifest_path}")
+    return mapping
+
+
+def main():
+    decks = sys.argv[1:] or DECKS
+    build(decks, OUT_DIR)
+
+
+if __name__ == "__main__":
+    main()
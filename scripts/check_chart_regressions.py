@@ -0,0 +1,193 @@
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import argparse
+import shutil
+import sys
+
+import numpy as np
+from PIL import Image, UnidentifiedImageError
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+CHART_GLOBS = [
+    "graphs/**/*.png",
+    "metr_horizon_chart.png",
+]
+
+BASELINE_DIR = PROJECT_ROOT / "baselines"
+DIFF_DIR = PROJECT_ROOT / "chart_diffs"
+
+# A pixel counts as changed when any RGBA channel moves by more than this.
+PIXEL_TOLERANCE = 8
+# Share of changed pixels allowed before a chart fails.
+MAX_CHANGED_FRACTION = 0.001
+# Allowed Hamming distance between 64-bit perceptual hashes.
+MAX_HASH_DISTANCE = 4
+
+HASH_SIZE = 8
+HASH_SAMPLE = 32
+
+
+def dct_matrix(n):
+    k = np.arange(n)[:, None]
+    i = np.arange(n)[None, :]
+    m = np.cos(np.pi * (2 * i + 1) * k / (2 * n)) * np.sqrt(2 / n)
+    m[0] /= np.sqrt(2)
+    return m
+
+
+DCT = dct_matrix(HASH_SAMPLE)
+
+
+def load_rgba(path):
+    with Image.open(path) as im:
+        return np.asarray(im.convert("RGBA"), dtype=np.int16)
+
+
+def perceptual_hash(rgba):
+    # Composite onto white first: the charts are saved with transparent
+    # backgrounds, so alpha carries most of the shape information.
+    alpha = rgba[..., 3:4] / 255.0
+    rgb = rgba[..., :3] * alpha + 255.0 * (1 - alpha)
+    gray = rgb @ np.array([0.299, 0.587, 0.114])
+    small = Image.fromarray(gray.astype(np.uint8)).resize((HASH_SAMPLE, HASH_SAMPLE), Image.LANCZOS)
+    coeffs = DCT @ np.asarray(small, dtype=np.float64) @ DCT.T
+    low = coeffs[:HASH_SIZE, :HASH_SIZE].ravel()[1:]
+    return low > np.median(low)
+
+
+def write_heatmap(baseline, diff, out_path):
+    # Faded baseline underneath, changed pixels in red scaled by magnitude.
+    alpha = baseline[..., 3:4] / 255.0
+    base = (baseline[..., :3] * alpha + 255.0 * (1 - alpha)) @ np.array([0.299, 0.587, 0.114])
+    heat = np.clip(diff / 64.0, 0, 1)
+    out = np.empty(diff.shape + (3,), dtype=np.float64)
+    faded = 255 - (255 - base) * 0.25
+    out[..., 0] = faded + (255 - faded) * heat
+    out[..., 1] = faded * (1 - heat)
+    out[..., 2] = faded * (1 - heat)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    Image.fromarray(out.astype(np.uint8), "RGB").save(out_path)
+
+
+def compare(rel_path, baseline_dir, diff_dir, pixel_tolerance, max_changed_fraction, max_hash_distance):
+    current_path = PROJECT_ROOT / rel_path
+    baseline_path = baseline_dir / rel_path
+    result = {"path": rel_path, "ok": False}
+    if not baseline_path.exists():
+        result["reason"] = "no baseline"
+        return result
+    if not current_path.exists():
+        result["reason"] = "missing output"
+        return result
+
+    # Byte-identical files need no decoding.
+    if current_path.read_bytes() == baseline_path.read_bytes():
+        result.update(ok=True, changed=0.0, mean_diff=0.0, hash_distance=0)
+        return result
+
+    try:
+        current = load_rgba(current_path)
+        baseline = load_rgba(baseline_path)
+    except (UnidentifiedImageError, OSError) as e:
+        result["reason"] = f"unreadable image: {e}"
+        return result
+    if current.shape != baseline.shape:
+        result["reason"] = f"size {current.shape[1]}x{current.shape[0]} != baseline {baseline.shape[1]}x{baseline.shape[0]}"
+        return result
+
+    diff = np.abs(current - baseline).max(axis=2)
+    changed = float((diff > pixel_tolerance).mean())
+    hash_distance = int(np.count_nonzero(perceptual_hash(current) != perceptual_hash(baseline)))
+    result.update(
+        changed=changed,
+        mean_diff=float(diff.mean()),
+        hash_distance=hash_distance,
+    )
+    result["ok"] = changed <= max_changed_fraction and hash_distance <= max_hash_distance
+    if not result["ok"]:
+        result["reason"] = f"{changed:.3%} pixels changed, phash distance {hash_distance}"
+        diff_path = diff_dir / rel_path
+        write_heatmap(baseline, diff, diff_path)
+        result["diff"] = str(diff_path)
+    return result
+
+
+def find_charts(baseline_dir=None):
+    # Include every baselined chart so one that is no longer generated fails.
+    charts = set()
+    for pattern in CHART_GLOBS:
+        charts.update(p.relative_to(PROJECT_ROOT).as_posix() for p in PROJECT_ROOT.glob(pattern))
+    if baseline_dir is not None and baseline_dir.exists():
+        charts.update(p.relative_to(baseline_dir).as_posix() for p in baseline_dir.rglob("*.png"))
+    return sorted(charts)
+
+
+def clear_diffs(charts, diff_dir):
+    # Only remove heatmaps this tool could have written, never the directory.
+    for rel_path in charts:
+        diff_path = diff_dir / rel_path
+        if diff_path.is_file():
+            diff_path.unlink()
+
+
+def update_baselines(charts, baseline_dir):
+    for rel_path in charts:
+        target = baseline_dir / rel_path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(PROJECT_ROOT / rel_path, target)
+        print(f"Saved: {target}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare generated charts against stored baselines.")
+    parser.add_argument("--update", action="store_true", help="overwrite the baselines with the current charts")
+    parser.add_argument("--baseline-dir", type=Path, default=BASELINE_DIR)
+    parser.add_argument("--diff-dir", type=Path, default=DIFF_DIR)
+    parser.add_argument("--pixel-tolerance", type=int, default=PIXEL_TOLERANCE)
+    parser.add_argument("--max-changed", type=float, default=MAX_CHANGED_FRACTION)
+    parser.add_argument("--max-hash-distance", type=int, default=MAX_HASH_DISTANCE)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    if args.update:
+        update_baselines(find_charts(), args.baseline_dir)
+        return
+
+    # Heatmaps mirror chart paths, so these directories would overwrite the
+    # charts or their baselines.
+    if args.diff_dir.resolve() in (PROJECT_ROOT, args.baseline_dir.resolve()):
+        parser.error(f"--diff-dir must not be the project root or the baseline dir: {args.diff_dir}")
+
+    charts = find_charts(args.baseline_dir)
+    clear_diffs(charts, args.diff_dir)
+
+    n = len(charts)
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        results = list(
+            pool.map(
+                compare,
+                charts,
+                [args.baseline_dir] * n,
+                [args.diff_dir] * n,
+                [args.pixel_tolerance] * n,
+                [args.max_changed] * n,
+                [args.max_hash_distance] * n,
+            )
+        )
+
+    failed = [r for r in results if not r["ok"]]
+    for r in results:
+        status = "ok  " if r["ok"] else "FAIL"
+        detail = r.get("reason") or f"{r['changed']:.3%} pixels changed, phash distance {r['hash_distance']}"
+        print(f"{status} {r['path']}: {detail}")
+        if "diff" in r:
+            print(f"     diff: {r['diff']}")
+
+    print(f"{n - len(failed)}/{n} charts match their baselines")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
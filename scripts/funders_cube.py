@@ -0,0 +1,103 @@
+from itertools import combinations
+from pathlib import Path
+import hashlib
+import os
+import re
+
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+SOURCE = PROJECT_ROOT / "data/science_funders_overview.ods"
+
+# Bump when the cleaning or rollup logic changes so persisted cubes rebuild.
+CUBE_SCHEMA = 3
+
+# Rollups are materialised for every combination of the dimensions present
+# in the sheet; optional columns simply add more rollups when they appear.
+DIMENSIONS = ["Category", "Program", "Country", "Year"]
+MEASURES = ["Spending in Euros", "Spending in Euros (inflation adjusted)"]
+PRIMARY_MEASURE = "Spending in Euros"
+
+
+def cube_path(source):
+    return source.with_suffix(".cube.pkl")
+
+
+def data_version(source):
+    h = hashlib.sha256(source.read_bytes())
+    h.update(f"schema={CUBE_SCHEMA}".encode())
+    return h.hexdigest()
+
+
+def clean_name(name):
+    return re.sub(r"\s+", " ", str(name)).strip()
+
+
+def clean_dimension(values):
+    # Missing and blank labels become NaN so dropna() and groupby() drop them.
+    cleaned = values.map(clean_name, na_action="ignore")
+    return cleaned.mask(cleaned == "")
+
+
+def load_funders(source):
+    df = pd.read_excel(source, engine="odf")
+    df.columns = [str(c).strip() for c in df.columns]
+    df["Program"] = clean_dimension(df["Program"])
+    df["Category"] = clean_dimension(df["Category"])
+    if "Country" in df.columns:
+        df["Country"] = clean_dimension(df["Country"])
+    if "Year" in df.columns:
+        df["Year"] = pd.to_numeric(df["Year"], errors="coerce").round().astype("Int64")
+    for measure in MEASURES:
+        if measure in df.columns:
+            df[measure] = pd.to_numeric(df[measure], errors="coerce")
+    return df.dropna(subset=["Program", "Category", PRIMARY_MEASURE]).copy()
+
+
+def build_cube(df):
+    dims = [d for d in DIMENSIONS if d in df.columns]
+    measures = [m for m in MEASURES if m in df.columns]
+    rollups = {(): df[measures].sum().to_frame().T}
+    for n in range(1, len(dims) + 1):
+        for key in combinations(dims, n):
+            rollups[key] = (
+                df.groupby(list(key), as_index=False)[measures]
+                .sum()
+                .sort_values(PRIMARY_MEASURE, ascending=False)
+                .reset_index(drop=True)
+            )
+    return rollups
+
+
+def load_cube(source=SOURCE):
+    # Rebuild only when the source bytes (or CUBE_SCHEMA) change; otherwise
+    # serve the persisted rollups without re-reading the spreadsheet.
+    path = cube_path(source)
+    version = data_version(source)
+    if path.exists():
+        try:
+            stored = pd.read_pickle(path)
+            if stored.get("version") == version:
+                return stored["rollups"]
+        except Exception as e:
+            print(f"Rebuilding {path}: could not read cached cube ({e})")
+
+    rollups = build_cube(load_funders(source))
+    tmp = path.with_name(f".{path.name}.tmp")
+    pd.to_pickle({"version": version, "rollups": rollups}, tmp)
+    os.replace(tmp, path)
+    print(f"Saved: {path}")
+    return rollups
+
+
+def cube_slice(cube, dims, **filters):
+    # Rollups are stored in DIMENSIONS order and pre-sorted by PRIMARY_MEASURE,
+    # so a slice is a dictionary lookup plus an optional row filter.
+    key = tuple(d for d in DIMENSIONS if d in dims or d in filters)
+    if key not in cube:
+        raise KeyError(f"No rollup for {key}; available: {sorted(cube)}")
+    d = cube[key]
+    for col, value in filters.items():
+        d = d[d[col] == value]
+    return d.copy()
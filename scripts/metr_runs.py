@@ -0,0 +1,253 @@
+from datetime import datetime
+from pathlib import Path
+import json
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+RUNS_PATH = PROJECT_ROOT / "data/metr-runs.jsonl"
+RELEASE_DATES_PATH = PROJECT_ROOT / "data/metr-release-dates.json"
+# Optional {alias: model key} map from the run logs' model names to the ids
+# used by the METR summary JSON and MODEL_META in plot_metr_horizon.py.
+MODEL_ALIASES_PATH = PROJECT_ROOT / "data/metr-model-aliases.json"
+
+# Column names in the run-level logs. WEIGHT_COL is used when present
+# (e.g. METR's per-run task weights); otherwise every run counts once.
+MODEL_COL = "alias"
+TASK_COL = "task_id"
+LENGTH_COL = "human_minutes"
+SCORE_COL = "score_binarized"
+WEIGHT_COL = "invsqrt_task_weight"
+
+CHUNK_ROWS = 500_000
+
+RIDGE = 0.1
+MAX_ITER = 50
+TOL = 1e-8
+Z = 1.96
+
+# Horizon CIs come from resampling tasks, since runs on one task share its
+# difficulty and are not independent trials.
+BOOTSTRAP_SAMPLES = 1000
+BOOTSTRAP_SEED = 0
+CI_PERCENTILES = (2.5, 97.5)
+MIN_VALID_BOOTSTRAP = 0.5
+
+TREND_START = datetime(2023, 1, 1)
+
+
+def aggregate_runs(runs_path, chunk_rows=CHUNK_ROWS):
+    # Stream the JSONL in chunks and keep only per (model, task) sums, so
+    # memory scales with models x tasks rather than with the number of runs.
+    totals = None
+    reader = pd.read_json(runs_path, lines=True, chunksize=chunk_rows, dtype=False)
+    for chunk in reader:
+        minutes = pd.to_numeric(chunk[LENGTH_COL], errors="coerce")
+        score = pd.to_numeric(chunk[SCORE_COL], errors="coerce")
+        if WEIGHT_COL in chunk.columns:
+            weight = pd.to_numeric(chunk[WEIGHT_COL], errors="coerce")
+        else:
+            weight = pd.Series(1.0, index=chunk.index)
+        keep = (minutes > 0) & score.notna() & (weight > 0)
+        w = weight[keep].to_numpy(dtype=np.float64)
+        part = pd.DataFrame({
+            "model": chunk.loc[keep, MODEL_COL].astype(str).to_numpy(),
+            "task": chunk.loc[keep, TASK_COL].astype(str).to_numpy(),
+            "log_len": np.log2(minutes[keep].to_numpy(dtype=np.float64)),
+            "runs": 1.0,
+            "weight": w,
+            "successes": w * score[keep].to_numpy(dtype=np.float64),
+        })
+        part = part.groupby(["model", "task"]).sum()
+        totals = part if totals is None else totals.add(part, fill_value=0)
+
+    if totals is None:
+        raise ValueError(f"No runs found in {runs_path}")
+    totals["log_len"] = totals["log_len"] / totals["runs"]
+    return totals
+
+
+def fit_logistic_batched(log_len, successes, trials):
+    # Ridge-regularised logistic regression of success on log2 task length,
+    # solved for every row at once with Newton steps on (N, 2, 2) systems.
+    # Inputs are (rows, tasks) arrays; unattempted tasks have trials == 0.
+    # Returns the fitted (intercept, slope) and a per-row convergence flag.
+    n_rows = log_len.shape[0]
+    theta = np.zeros((n_rows, 2))
+    ridge = RIDGE * np.eye(2)
+    hess = np.empty((n_rows, 2, 2))
+    converged = np.zeros(n_rows, dtype=bool)
+    for _ in range(MAX_ITER):
+        p = 1.0 / (1.0 + np.exp(-(theta[:, :1] + theta[:, 1:] * log_len)))
+        w = trials * p * (1 - p)
+        r = successes - trials * p
+        grad = np.stack([r.sum(axis=1), (r * log_len).sum(axis=1)], axis=1) - theta @ ridge
+        wx = (w * log_len).sum(axis=1)
+        hess[:, 0, 0] = w.sum(axis=1)
+        hess[:, 0, 1] = wx
+        hess[:, 1, 0] = wx
+        hess[:, 1, 1] = (w * log_len**2).sum(axis=1)
+        hess += ridge
+        step = np.linalg.solve(hess, grad[..., None])[..., 0]
+        step[converged] = 0.0
+        theta += step
+        converged |= np.abs(step).max(axis=1) < TOL
+        if converged.all():
+            break
+    return theta, converged
+
+
+def log2_horizon(theta):
+    # 50% point is where intercept + slope * x = 0. A non-negative slope means
+    # success does not fall with task length, so there is no horizon.
+    a, b = theta[:, 0], theta[:, 1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x50 = np.where(b < 0, -a / b, np.nan)
+    return x50
+
+
+def bootstrap_log2_horizons(log_len, successes, trials, rng, n_boot=BOOTSTRAP_SAMPLES):
+    # Resample one model's attempted tasks with replacement and refit all
+    # resamples in a single batched solve.
+    attempted = np.flatnonzero(trials > 0)
+    draws = rng.choice(attempted, size=(n_boot, attempted.size))
+    counts = np.zeros((n_boot, trials.size))
+    np.add.at(counts, (np.arange(n_boot)[:, None], draws), 1.0)
+    theta, converged = fit_logistic_batched(
+        np.broadcast_to(log_len, counts.shape),
+        successes * counts,
+        trials * counts,
+    )
+    x50 = log2_horizon(theta)
+    return x50[converged & np.isfinite(x50)]
+
+
+def fit_horizons(totals, n_boot=BOOTSTRAP_SAMPLES, seed=BOOTSTRAP_SEED):
+    table = totals.reset_index()
+    models = sorted(table["model"].unique())
+    tasks = sorted(table["task"].unique())
+    shape = (len(models), len(tasks))
+    rows = table["model"].map({m: i for i, m in enumerate(models)}).to_numpy()
+    cols = table["task"].map({t: j for j, t in enumerate(tasks)}).to_numpy()
+
+    log_len = np.zeros(shape)
+    runs = np.zeros(shape)
+    weight = np.zeros(shape)
+    successes = np.zeros(shape)
+    log_len[rows, cols] = table["log_len"].to_numpy()
+    runs[rows, cols] = table["runs"].to_numpy()
+    weight[rows, cols] = table["weight"].to_numpy()
+    successes[rows, cols] = table["successes"].to_numpy()
+
+    # Rescale each model's weights to sum to its run count, so the ridge
+    # penalty has the same strength whatever scale the weight column uses.
+    scale = (runs.sum(axis=1) / weight.sum(axis=1))[:, None]
+    trials = weight * scale
+    successes = successes * scale
+
+    theta, converged = fit_logistic_batched(log_len, successes, trials)
+    x50 = log2_horizon(theta)
+
+    rng = np.random.default_rng(seed)
+    horizons = {}
+    for i, model in enumerate(models):
+        if not converged[i]:
+            print(f"Skipping {model}: logistic fit did not converge in {MAX_ITER} iterations")
+            continue
+        if not np.isfinite(x50[i]):
+            print(f"Skipping {model}: no decreasing success curve")
+            continue
+        boot = bootstrap_log2_horizons(log_len[i], successes[i], trials[i], rng, n_boot)
+        if boot.size < MIN_VALID_BOOTSTRAP * n_boot:
+            print(f"Skipping {model}: only {boot.size}/{n_boot} bootstrap fits have a horizon")
+            continue
+        lo, hi = np.percentile(boot, CI_PERCENTILES)
+        horizons[model] = {
+            "estimate": float(2 ** x50[i]),
+            "ci_low": float(2 ** lo),
+            "ci_high": float(2 ** hi),
+        }
+    return horizons
+
+
+def doubling_time(results):
+    points = [
+        (datetime.strptime(r["release_date"], "%Y-%m-%d"), r["metrics"]["p50_horizon_length"]["estimate"])
+        for r in results.values()
+        if r["metrics"]["is_sota"]
+    ]
+    points = [(d, v) for d, v in points if d >= TREND_START]
+    if len(points) < 3:
+        raise ValueError("Need at least three frontier models since 2023 to fit a doubling time")
+
+    days = np.array([(d - TREND_START).days for d, _ in points], dtype=np.float64)
+    log_h = np.log2([v for _, v in points])
+    X = np.column_stack([np.ones_like(days), days])
+    coef, res, _, _ = np.linalg.lstsq(X, log_h, rcond=None)
+    dof = len(days) - 2
+    sigma2 = float(res[0]) / dof if res.size and dof > 0 else 0.0
+    slope_se = np.sqrt(sigma2 * np.linalg.inv(X.T @ X)[1, 1])
+    slope = coef[1]
+    if slope <= 0:
+        raise ValueError(f"Frontier horizons since {TREND_START:%Y-%m-%d} do not grow; cannot fit a doubling time")
+    doubling = {
+        "point_estimate": float(1 / slope),
+        "ci_low": float(1 / (slope + Z * slope_se)),
+        "ci_high": float(1 / max(slope - Z * slope_se, 1e-12)),
+    }
+    anchor = {"date": f"{TREND_START:%Y-%m-%d}", "value": float(2 ** coef[0])}
+    return doubling, anchor
+
+
+def load_horizons(
+    runs_path=RUNS_PATH,
+    release_dates_path=RELEASE_DATES_PATH,
+    aliases_path=MODEL_ALIASES_PATH,
+):
+    # Same layout as the METR summary JSON, so plot_metr_horizon.py can use
+    # either source, plus a "trend_anchor" fitted from these horizons.
+    # The fit and task-level bootstrap are ours: the numbers are close to,
+    # but not the same as, METR's published estimates.
+    with open(release_dates_path) as f:
+        release_dates = json.load(f)
+    aliases = {}
+    if aliases_path.exists():
+        with open(aliases_path) as f:
+            aliases = json.load(f)
+
+    fitted = fit_horizons(aggregate_runs(runs_path))
+    horizons = {aliases.get(m, m): h for m, h in fitted.items()}
+
+    missing = sorted(set(horizons) - set(release_dates))
+    if missing:
+        print(f"Warning: skipping models without a release date: {', '.join(missing)}")
+    unused = sorted(set(release_dates) - set(horizons))
+    if unused:
+        print(f"Warning: release dates for models not fitted from the run logs: {', '.join(unused)}")
+
+    dated = sorted(
+        (release_dates[m], m) for m in horizons if m in release_dates
+    )
+
+    results = {}
+    best = 0.0
+    for release_date, model in dated:
+        p50 = horizons[model]
+        results[model] = {
+            "release_date": release_date,
+            "metrics": {
+                "p50_horizon_length": p50,
+                "is_sota": p50["estimate"] >= best,
+            },
+        }
+        best = max(best, p50["estimate"])
+
+    doubling, anchor = doubling_time(results)
+    print(f"Note: horizons refitted from {runs_path} with task-bootstrap CIs; they are not METR's published estimates")
+    return {
+        "results": results,
+        "doubling_time_in_days": {"from_2023_on": doubling},
+        "trend_anchor": anchor,
+    }
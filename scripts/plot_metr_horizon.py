@@ -7,11 +7,17 @@ import matplotlib.font_manager as fm
 from datetime import datetime, timedelta
 from pathlib import Path
 
+import metr_runs
+
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 
 # ── Load data ──
-with open(PROJECT_ROOT / "data/metr-horizon-v1.1.json") as f:
-    data = json.load(f)
+# Prefer horizons fitted from the run-level logs; fall back to METR's summary.
+if metr_runs.RUNS_PATH.exists():
+    data = metr_runs.load_horizons()
+else:
+    with open(PROJECT_ROOT / "data/metr-horizon-v1.1.json") as f:
+        data = json.load(f)
 
 doubling_days = data["doubling_time_in_days"]["from_2023_on"]["point_estimate"]  # ~128 days
 
@@ -72,6 +78,12 @@ LABEL_SET = {
     "claude_opus_4_5_inspect", "gpt_5_2",
 }
 
+# Fitted run logs may use other model ids than the summary JSON.
+unknown_keys = sorted(set(data["results"]) - set(MODEL_META))
+if unknown_keys:
+    print(f"Warning: no MODEL_META entry for {', '.join(unknown_keys)}; "
+          "plotted as non-frontier without labels (see data/metr-model-aliases.json)")
+
 # ── Parse models ──
 models = []
 for key, result in data["results"].items():
@@ -94,9 +106,13 @@ models.sort(key=lambda m: m["date"])
 # ── Y-axis cap at 500 hours (~3 weeks) ──
 Y_MAX = 500
 
-# ── Trend line: anchor on GPT-4 (2023-03-14, ~3.52h) ──
-anchor_date = datetime(2023, 3, 14)
-anchor_hours = 3.52
+# ── Trend line: anchor on GPT-4 (2023-03-14, ~3.52h), or on the fitted trend ──
+if "trend_anchor" in data:
+    anchor_date = datetime.strptime(data["trend_anchor"]["date"], "%Y-%m-%d")
+    anchor_hours = data["trend_anchor"]["value"]
+else:
+    anchor_date = datetime(2023, 3, 14)
+    anchor_hours = 3.52
 slope = np.log(2) / doubling_days
 
 date_min = datetime(2019, 1, 1)
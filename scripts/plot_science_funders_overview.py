@@ -1,9 +1,9 @@
 from pathlib import Path
-import re
 
 import matplotlib.font_manager as fm
 import matplotlib.pyplot as plt
-import pandas as pd
+
+from funders_cube import SOURCE, cube_slice, load_cube
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 
@@ -81,10 +81,6 @@ def euro_label(v):
     return f"EUR {v / 1_000_000:.0f}M"
 
 
-def clean_name(name):
-    return re.sub(r"\s+", " ", str(name)).strip()
-
-
 def save_plot(fig, out_path):
     fig.patch.set_alpha(0.0)
     fig.savefig(out_path, dpi=220, transparent=True)
@@ -92,9 +88,8 @@ def save_plot(fig, out_path):
     print(f"Saved: {out_path}")
 
 
-def plot_program_spending(df, out_dir, title_font):
-    d = df.sort_values("Spending in Euros", ascending=False).copy()
-    d["Program"] = d["Program"].map(clean_name)
+def plot_program_spending(cube, out_dir, title_font):
+    d = cube_slice(cube, ["Category", "Program"])
     colors = [CATEGORY_COLORS.get(c, COLORS["purple"]) for c in d["Category"]]
 
     fig, ax = plt.subplots(figsize=(13, 8))
@@ -119,12 +114,8 @@ def plot_program_spending(df, out_dir, title_font):
     save_plot(fig, out_dir / "funders_spending_by_program.png")
 
 
-def plot_category_totals(df, out_dir, title_font):
-    d = (
-        df.groupby("Category", as_index=False)["Spending in Euros"]
-        .sum()
-        .sort_values("Spending in Euros", ascending=False)
-    )
+def plot_category_totals(cube, out_dir, title_font):
+    d = cube_slice(cube, ["Category"])
     colors = [CATEGORY_COLORS.get(c, COLORS["purple"]) for c in d["Category"]]
 
     fig, ax = plt.subplots(figsize=(11, 6.5))
@@ -140,9 +131,8 @@ def plot_category_totals(df, out_dir, title_font):
     save_plot(fig, out_dir / "funders_spending_by_category.png")
 
 
-def plot_us_breakdown(df, out_dir, title_font):
-    d = df[df["Category"] == "US Government"].sort_values("Spending in Euros", ascending=False).copy()
-    d["Program"] = d["Program"].map(clean_name)
+def plot_us_breakdown(cube, out_dir, title_font):
+    d = cube_slice(cube, ["Program"], Category="US Government")
 
     fig, ax = plt.subplots(figsize=(12, 6.5))
     bars = ax.barh(d["Program"], d["Spending in Euros"], color=COLORS["red"], edgecolor="white", linewidth=1.0)
@@ -160,7 +150,6 @@ def plot_us_breakdown(df, out_dir, title_font):
 
 
 def main():
-    source = PROJECT_ROOT / "data/science_funders_overview.ods"
     out_dir = PROJECT_ROOT / "graphs/science_funders"
     out_dir.mkdir(parents=True, exist_ok=True)
 
@@ -175,16 +164,11 @@ def main():
         }
     )
 
-    df = pd.read_excel(source, engine="odf")
-    df.columns = [str(c).strip() for c in df.columns]
-    df["Program"] = df["Program"].astype(str).str.strip()
-    df["Category"] = df["Category"].astype(str).str.strip()
-    df["Spending in Euros"] = pd.to_numeric(df["Spending in Euros"], errors="coerce")
-    df = df.dropna(subset=["Program", "Category", "Spending in Euros"]).copy()
+    cube = load_cube(SOURCE)
 
-    plot_program_spending(df, out_dir, title_font)
-    plot_category_totals(df, out_dir, title_font)
-    plot_us_breakdown(df, out_dir, title_font)
+    plot_program_spending(cube, out_dir, title_font)
+    plot_category_totals(cube, out_dir, title_font)
+    plot_us_breakdown(cube, out_dir, title_font)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,280 @@
+from html.parser import HTMLParser
+from pathlib import Path
+import ast
+import csv
+import re
+import string
+
+from fontTools import subset
+from fontTools.ttLib import TTFont
+from fontTools.varLib import instancer
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+DECKS = [
+    "index.html",
+    "Policy Laundery List Version.html",
+]
+
+CHART_SCRIPTS = [
+    "scripts/plot_metr_horizon.py",
+    "scripts/plot_science_report_graphs.py",
+    "scripts/plot_science_funders_overview.py",
+]
+
+SOURCE_FONT_DIRS = [
+    PROJECT_ROOT / "fonts/plus-jakarta-sans",
+    PROJECT_ROOT / "fonts/playfair-display",
+    PROJECT_ROOT / "fonts",
+]
+
+OUT_DIR = PROJECT_ROOT / "fonts/subset"
+
+GOOGLE_FONTS_CSS = re.compile(r"https://fonts\.googleapis\.com/css2\?[^\"']+")
+GOOGLE_FONTS_LINK = re.compile(
+    r"[ \t]*<link[^>]+https://fonts\.(?:googleapis|gstatic)\.com[^>]*>[ \t]*\n?",
+    re.IGNORECASE,
+)
+WEIGHT_DECL = re.compile(r"(?:font-)?weight:\s*['\"]?(\d{3}|bold|normal)\b", re.IGNORECASE)
+
+# Always keep basic Latin so numbers and punctuation in value labels render.
+BASE_CHARS = set(string.printable) - set(string.whitespace) | {" "}
+
+WEIGHT_KEYWORDS = {"normal": 400, "bold": 700}
+
+
+class TextCollector(HTMLParser):
+    def __init__(self):
+        super().__init__()
+        self.chars = set()
+
+    def handle_data(self, data):
+        self.chars.update(data)
+
+
+def deck_text_chars(htmls):
+    chars = set()
+    for html in htmls:
+        parser = TextCollector()
+        parser.feed(html)
+        chars |= parser.chars
+    return chars
+
+
+def script_string_chars(script_paths):
+    # Titles, axis labels and MODEL_META display names are string literals in
+    # the plotting scripts; collect them without executing the scripts.
+    chars = set()
+    for script_path in script_paths:
+        if not script_path.exists():
+            continue
+        tree = ast.parse(script_path.read_text(encoding="utf-8"))
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Constant) and isinstance(node.value, str):
+                chars.update(node.value)
+    return chars
+
+
+def chart_data_chars():
+    chars = set()
+    csv_path = PROJECT_ROOT / "data/Science_Report_Data.csv"
+    if csv_path.exists():
+        with open(csv_path, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                for key in ("indicator", "region", "unit"):
+                    chars.update(row.get(key) or "")
+
+    ods_path = PROJECT_ROOT / "data/science_funders_overview.ods"
+    if ods_path.exists():
+        df = pd.read_excel(ods_path, engine="odf")
+        df.columns = [str(c).strip() for c in df.columns]
+        for col in ("Program", "Category"):
+            if col in df.columns:
+                for value in df[col].dropna().astype(str):
+                    chars.update(value)
+    return chars
+
+
+def requested_families(htmls):
+    # Families and weights requested from Google Fonts, e.g.
+    # "family=Playfair+Display:wght@400;600;700".
+    families = {}
+    for html in htmls:
+        for url in GOOGLE_FONTS_CSS.findall(html):
+            for m in re.finditer(r"family=([^:&]+)(?::wght@([\d;]+))?", url):
+                family = m.group(1).replace("+", " ")
+                weights = {int(w) for w in (m.group(2) or "400").split(";")}
+                families.setdefault(family, set()).update(weights)
+    return families
+
+
+def used_weights(htmls):
+    # 400 is the default and 700 covers <strong>, <b> and headings.
+    weights = {400, 700}
+    for html in htmls:
+        for m in WEIGHT_DECL.finditer(html):
+            value = m.group(1).lower()
+            weights.add(WEIGHT_KEYWORDS.get(value) or int(value))
+    return weights
+
+
+def font_family_name(font):
+    name = font["name"]
+    return str(name.getDebugName(16) or name.getDebugName(1) or "")
+
+
+def normalize(name):
+    return re.sub(r"[^a-z0-9]", "", name.lower())
+
+
+def is_italic(font):
+    return bool(font["OS/2"].fsSelection & 0x01)
+
+
+def find_source_fonts(family):
+    # Returns (path, min_weight, max_weight) per upright source font; static
+    # fonts have min == max. Only metadata is read here, and handles are closed.
+    sources = []
+    seen = set()
+    for font_dir in SOURCE_FONT_DIRS:
+        if not font_dir.exists():
+            continue
+        for pattern in ("*.ttf", "*.otf"):
+            for font_file in font_dir.rglob(pattern):
+                if OUT_DIR in font_file.parents or font_file in seen:
+                    continue
+                seen.add(font_file)
+                try:
+                    with TTFont(font_file, lazy=True) as font:
+                        if normalize(font_family_name(font)) != normalize(family) or is_italic(font):
+                            continue
+                        axes = {a.axisTag: a for a in font["fvar"].axes} if "fvar" in font else {}
+                        if "wght" in axes:
+                            weights = (axes["wght"].minValue, axes["wght"].maxValue)
+                        else:
+                            weights = (font["OS/2"].usWeightClass,) * 2
+                except Exception:
+                    continue
+                sources.append((font_file, *weights))
+    return sources
+
+
+def nearest_source(sources, weight):
+    # Pick the source that can render the closest weight to the one requested.
+    def best(source):
+        _, lo, hi = source
+        available = min(max(weight, lo), hi)
+        return abs(available - weight), available
+
+    source = min(sources, key=best)
+    return source[0], best(source)[1]
+
+
+def load_weight(font_file, weight):
+    font = TTFont(font_file)
+    if "fvar" not in font:
+        return font
+    with font:
+        return instancer.instantiateVariableFont(font, {"wght": weight})
+
+
+def slug(text):
+    return re.sub(r"[^a-z0-9]+", "-", text.strip().lower()).strip("-")
+
+
+def subset_font(font, chars, out_path):
+    options = subset.Options()
+    options.flavor = "woff2"
+    options.layout_features = ["kern", "liga", "calt", "ccmp", "locl", "mark", "mkmk"]
+    options.name_IDs = ["*"]
+    options.notdef_outline = True
+    subsetter = subset.Subsetter(options=options)
+    subsetter.populate(unicodes={ord(c) for c in chars})
+    subsetter.subset(font)
+    subset.save_font(font, str(out_path), options)
+
+
+def collect_chars(htmls):
+    chars = BASE_CHARS | deck_text_chars(htmls)
+    chars |= script_string_chars(PROJECT_ROOT / s for s in CHART_SCRIPTS)
+    chars |= chart_data_chars()
+    return {c for c in chars if c.isprintable()}
+
+
+def build_subsets(htmls, out_dir=OUT_DIR):
+    htmls = list(htmls)
+    families = requested_families(htmls)
+    if not families:
+        return []
+
+    sources = {family: find_source_fonts(family) for family in families}
+    missing = sorted(family for family, found in sources.items() if not found)
+    if missing:
+        dirs = ", ".join(str(d) for d in SOURCE_FONT_DIRS)
+        raise FileNotFoundError(f"No source fonts for {', '.join(missing)} in {dirs}")
+
+    chars = collect_chars(htmls)
+    weights = used_weights(htmls)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    faces = []
+    written = {}
+    for family, requested in sorted(families.items()):
+        for weight in sorted(requested & weights):
+            font_file, available = nearest_source(sources[family], weight)
+            if available != weight:
+                print(f"Warning: {family} {weight} not available, using weight {available} from {font_file.name}")
+            # Weights that fall back to the same source share one subset file.
+            out_path = written.get((font_file, available))
+            if out_path is None:
+                out_path = out_dir / f"{slug(family)}-{available}.woff2"
+                with load_weight(font_file, available) as font:
+                    subset_font(font, chars, out_path)
+                written[(font_file, available)] = out_path
+                print(f"Saved: {out_path} ({out_path.stat().st_size / 1024:.1f} KiB)")
+            faces.append({"family": family, "weight": weight, "path": out_path})
+    return faces
+
+
+def font_head(faces, base_dir=PROJECT_ROOT):
+    lines = []
+    for path in dict.fromkeys(face["path"] for face in faces):
+        href = path.relative_to(base_dir).as_posix()
+        lines.append(f'    <link rel="preload" href="{href}" as="font" type="font/woff2" crossorigin>')
+    lines.append("    <style>")
+    for face in faces:
+        href = face["path"].relative_to(base_dir).as_posix()
+        lines.append(
+            f"        @font-face {{ font-family: '{face['family']}'; font-style: normal; "
+            f"font-weight: {face['weight']}; font-display: block; src: url('{href}') format('woff2'); }}"
+        )
+    lines.append("    </style>")
+    return "\n".join(lines) + "\n"
+
+
+def apply_font_head(html, faces, base_dir=PROJECT_ROOT):
+    # Swap the Google Fonts preconnects and stylesheet for the local subsets,
+    # keeping the new block where the old stylesheet link was.
+    head = font_head(faces, base_dir)
+    replaced = []
+
+    def replace(m):
+        if replaced:
+            return ""
+        replaced.append(m)
+        return head
+
+    return GOOGLE_FONTS_LINK.sub(replace, html)
+
+
+def main():
+    htmls = [(PROJECT_ROOT / d).read_text(encoding="utf-8") for d in DECKS]
+    faces = build_subsets(htmls)
+    if faces:
+        total = sum(face["path"].stat().st_size for face in faces)
+        print(f"Wrote {len(faces)} subset faces ({total / 1024:.1f} KiB total)")
+
+
+if __name__ == "__main__":
+    main()